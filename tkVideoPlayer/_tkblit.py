@@ -0,0 +1,90 @@
+#region Imports
+
+
+# Standard Library
+import ctypes
+import ctypes.util
+
+# Standard Library - GUI
+import tkinter as tk
+import _tkinter
+
+# Type Hinting
+from typing import Any, Optional
+
+
+#endregion
+#region Tk Library
+
+
+# Tk_PhotoPutBlock composite rule: overwrite destination pixels
+TK_PHOTO_COMPOSITE_SET = 1
+
+
+class _PhotoImageBlock(ctypes.Structure):
+    """Mirror of Tk's Tk_PhotoImageBlock."""
+    _fields_ = [
+        ("pixelPtr", ctypes.c_void_p),
+        ("width", ctypes.c_int),
+        ("height", ctypes.c_int),
+        ("pitch", ctypes.c_int),
+        ("pixelSize", ctypes.c_int),
+        ("offset", ctypes.c_int * 4),
+    ]
+
+
+def _load_tk() -> Optional[ctypes.CDLL]:
+    """Find the Tk library tkinter is linked against, or None if its photo API is unreachable."""
+    version = str(tk.TkVersion)
+    candidates = (
+        getattr(_tkinter, "__file__", None),  # Linux/macOS: resolves symbols of the linked Tk
+        ctypes.util.find_library("tk" + version),
+        ctypes.util.find_library("tk" + version.replace(".", "") + "t"),  # Windows: tk86t.dll
+    )
+    for name in candidates:
+        if not name:
+            continue
+        try:
+            lib = ctypes.CDLL(name)
+            find_photo = lib.Tk_FindPhoto
+            put_block = lib.Tk_PhotoPutBlock
+        except (OSError, AttributeError):
+            continue
+        find_photo.argtypes = (ctypes.c_void_p, ctypes.c_char_p)
+        find_photo.restype = ctypes.c_void_p
+        put_block.argtypes = (
+            ctypes.c_void_p, ctypes.c_void_p, ctypes.POINTER(_PhotoImageBlock),
+            ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+        )
+        put_block.restype = ctypes.c_int
+        return lib
+    return None
+
+
+_tk_lib = _load_tk()
+
+# True when frames can be copied straight into Tk photo images without going through PIL
+AVAILABLE = _tk_lib is not None
+
+
+#endregion
+#region Blit
+
+
+def put_block(photo_image: Any, plane: Any) -> bool:
+    """Copy a packed rgb24 av plane into a PhotoImage. Main thread only.
+    Returns False if the blit is unavailable or Tk rejected it, so callers can fall back to paste().
+    """
+    if _tk_lib is None:
+        return False
+    interp = photo_image.tk.interpaddr()
+    handle = _tk_lib.Tk_FindPhoto(interp, str(photo_image).encode())
+    if not handle:
+        return False
+    # Alpha offset beyond pixelSize tells Tk the block has no alpha channel
+    block = _PhotoImageBlock(plane.buffer_ptr, plane.width, plane.height, plane.line_size, 3, (0, 1, 2, 3))
+    result = _tk_lib.Tk_PhotoPutBlock(interp, handle, ctypes.byref(block), 0, 0, plane.width, plane.height, TK_PHOTO_COMPOSITE_SET)
+    return result == 0
+
+
+#endregion
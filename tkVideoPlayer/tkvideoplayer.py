@@ -2,8 +2,8 @@
 
 
 # Standard Library
-import gc
 import time
+import math
 import logging
 import threading
 
@@ -12,14 +12,26 @@ import tkinter as tk
 
 # Third-Party Libraries
 import av
+from av.codec.hwaccel import HWAccel, hwdevices_available
+from av.video.reformatter import VideoReformatter
 from PIL import Image, ImageOps, ImageTk
 
+# Local
+from tkVideoPlayer import _tkblit
+
 # Type Hinting
-from typing import Dict, Tuple, Optional, Any
+from typing import Dict, Tuple, Optional, Any, Iterator
 
 # Suppress libav logging
 logging.getLogger('libav').setLevel(logging.ERROR)
 
+logger = logging.getLogger(__name__)
+
+# Pillow-SIMD marks its releases with a ".postN" suffix
+_PILLOW_SIMD = "post" in getattr(Image, "__version__", "")
+if not _PILLOW_SIMD:
+    logger.info("Install pillow-simd for a 2-6x resize speedup")
+
 
 #endregion
 #region TkinterVideo
@@ -36,6 +48,8 @@ class TkinterVideo(tk.Label):
         consistent_frame_rate: bool = True,
         keep_aspect: bool = False,
         *args: Any,
+        hwaccel: Optional[str] = None,
+        codec_name: Optional[str] = None,
         **kwargs: Any
     ) -> None:
         super(TkinterVideo, self).__init__(master, *args, **kwargs)
@@ -46,20 +60,51 @@ class TkinterVideo(tk.Label):
         self._is_paused = True
         self._should_stop = True
 
+        # Wakes the load thread while paused (play, seek, stop)
+        self._resume_event = threading.Event()
+
         # Skip frames to maintain frame rate if decoding is slow
         self.consistent_frame_rate = consistent_frame_rate
 
         self._video_container = None
 
+        # Hardware decoder device type, e.g. "cuda", "videotoolbox", "d3d11va"
+        self._hwaccel = hwaccel
+        # Explicit decoder name, e.g. "h264_cuvid", "hevc_qsv", "h264_v4l2m2m"
+        self._codec_name = codec_name
+
+        self._frame_image = None
+        self._frame_plane = None
         self._current_frame_image = None
         self._current_frame_tk = None
+        self._last_av_frame = None
         self._current_frame_number = 0
         self._current_timestamp = 0
 
         self._current_display_size = (0, 0)
+        self._resize_after_id = None
+        self._src_w, self._src_h = 0, 0
+        self._src_ratio = 0.0
+
+        # Double-buffered PhotoImages reused across frames of the same size
+        self._photo_pool = [None, None]
+        self._photo_idx = 0
+        # Matching pair of PIL images the display fallback unpacks into; main thread only
+        self._image_pool = [None, None]
+        self._image_idx = 0
+
+        # Shared across frames so swscale reuses its context while size and format stay the same.
+        # PyAV releases the GIL while scaling, so the lock stops a second thread (e.g. a load thread
+        # still finishing after stop() and play()) from freeing the context mid-scale
+        self._reformatter = VideoReformatter()
+        self._reformat_lock = threading.Lock()
 
         self._should_seek = False
         self._seek_seconds = 0
+        self._should_redraw = False
+
+        # Per-frame copy of video_info()["framerate"], avoiding a dict lookup in the frame loop
+        self._framerate = 0
 
         self._video_info = {
             "duration": 0,
@@ -69,10 +114,9 @@ class TkinterVideo(tk.Label):
 
         self.set_scaled(scaled)
         self._keep_aspect_ratio = keep_aspect
-        self._resampling_method: int = Image.NEAREST
+        self._resampling_method: int = Image.BILINEAR
 
         self.bind("<<Destroy>>", self.stop)
-        self.bind("<<FrameGenerated>>", self._display_frame)
 
 
 #endregion
@@ -89,6 +133,7 @@ class TkinterVideo(tk.Label):
         """Start video playback."""
         self._is_paused = False
         self._should_stop = False
+        self._resume_event.set()
         if not self._video_load_thread:
             self._video_load_thread = threading.Thread(target=self._load, args=(self.video_path,), daemon=True)
             self._video_load_thread.start()
@@ -97,6 +142,7 @@ class TkinterVideo(tk.Label):
     def pause(self) -> None:
         """Pause video playback."""
         self._is_paused = True
+        self._resume_event.clear()
 
 
     def stop(self, _event: Optional[Any] = None) -> None:
@@ -105,6 +151,7 @@ class TkinterVideo(tk.Label):
         del _event
         self._is_paused = True
         self._should_stop = True
+        self._resume_event.set()
         self._cleanup()
 
 
@@ -114,6 +161,7 @@ class TkinterVideo(tk.Label):
         """
         self._should_seek = True
         self._seek_seconds = seconds
+        self._resume_event.set()
         if precise and self._is_paused:
             time.sleep(0.01)
 
@@ -145,7 +193,7 @@ class TkinterVideo(tk.Label):
 
 
     def current_img(self) -> Optional[Image.Image]:
-        """Return current frame image."""
+        """Return the current frame image."""
         return self._current_frame_image
 
 
@@ -164,25 +212,39 @@ class TkinterVideo(tk.Label):
 
 
     def set_resampling_method(self, resampling_method: int) -> None:
-        """Set image resampling method for resizing."""
+        """Set image resampling method for resizing.
+        Image.BOX is fastest for pure downscaling; Image.BILINEAR (default) suits arbitrary scaling.
+        """
         self._resampling_method = resampling_method
 
 
     def set_size(self, display_size: Tuple[int, int], keep_aspect_ratio: bool = False) -> None:
-        """Set video display size."""
+        """Set video display size.
+        A size much smaller than the video lets the decoder run at reduced resolution for the rest of
+        the video; growing it again later upscales those frames until the video is loaded again.
+        """
         self.set_scaled(False, self._keep_aspect_ratio)
         self._current_display_size = display_size
         self._keep_aspect_ratio = keep_aspect_ratio
+        self._warn_if_lowres_limits(display_size)
 
 
     def set_scaled(self, scaled: bool, keep_aspect_ratio: bool = False) -> None:
-        """Enable or disable scaling and aspect ratio."""
+        """Enable or disable scaling and aspect ratio.
+        Enabling scaling on a video decoding at reduced resolution (see set_size) upscales its frames
+        until the video is loaded again.
+        """
         self.scaled = scaled
         self._keep_aspect_ratio = keep_aspect_ratio
         if scaled:
             self.bind("<Configure>", self._resize_event)
+            self._warn_if_lowres_limits()
         else:
             self.unbind("<Configure>")
+            # Don't let a pending resize override the fixed size
+            if self._resize_after_id is not None:
+                self.after_cancel(self._resize_after_id)
+                self._resize_after_id = None
             self._current_display_size = self.video_info()["framesize"]
 
 
@@ -191,12 +253,28 @@ class TkinterVideo(tk.Label):
 
 
     def _resize_event(self, event: tk.Event) -> None:
-        self._current_display_size = event.width, event.height
-        if self._is_paused and self._current_frame_image and self.scaled:
+        # Window drags fire <Configure> for every pixel; only apply the last size in a 50 ms window
+        if self._resize_after_id is not None:
+            self.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.after(50, self._do_resize, event.width, event.height)
+
+
+    def _do_resize(self, width: int, height: int) -> None:
+        """Apply a new display size and redraw the paused frame at that size."""
+        self._resize_after_id = None
+        self._current_display_size = width, height
+        has_frame = self._frame_image is not None or self._frame_plane is not None
+        if self._is_paused and has_frame and self.scaled:
+            if self._video_load_thread is not None:
+                # The load thread owns the decoded frame; have it rescale that in swscale
+                # rather than resizing the already scaled image here
+                self._should_redraw = True
+                self._resume_event.set()
+                return
             if self._keep_aspect_ratio:
-                resized_image = ImageOps.contain(self._current_frame_image.copy(), self._current_display_size)
+                resized_image = ImageOps.contain(self._current_frame_image, self._current_display_size, self._resampling_method)
             else:
-                resized_image = self._current_frame_image.copy().resize(self._current_display_size)
+                resized_image = self._current_frame_image.resize(self._current_display_size, self._resampling_method)
             photo_image = self._create_photoimage(resized_image)
             self._safe_config_image(photo_image)
 
@@ -212,9 +290,12 @@ class TkinterVideo(tk.Label):
             self._video_container.streams.video[0].height,
         )
         self._video_info["framesize"] = intrinsic_size
+        # Stream intrinsics never change during playback; cache them for the per-frame sizing math
+        self._src_w, self._src_h = intrinsic_size
+        self._src_ratio = self._src_w / self._src_h
         if self._current_display_size == (0, 0):
             self._current_display_size = intrinsic_size
-        if self._current_frame_image is None:
+        if self._frame_image is None and self._frame_plane is None:
             blank_image = Image.new("RGBA", intrinsic_size, (255, 0, 0, 0))
             self._current_frame_image = blank_image
             photo_image = self._create_photoimage(blank_image)
@@ -233,25 +314,81 @@ class TkinterVideo(tk.Label):
 #region Display Frame
 
 
-    def _display_frame(self, _event: Optional[Any]) -> None:
-        """Update label with current frame image."""
-        # _event is not used; it's provided when called via event_generate/bind
-        del _event
+    @property
+    def _current_frame_image(self) -> Optional[Image.Image]:
+        """Current frame as a PIL image, built on first access when only the RGB plane is held."""
+        frame_image, frame_plane = self._frame_image, self._frame_plane
+        if frame_image is None and frame_plane is not None:
+            frame_image = self._image_from_plane(frame_plane)
+            if self._frame_plane is frame_plane:
+                self._frame_image = frame_image
+        return frame_image
+
+
+    @_current_frame_image.setter
+    def _current_frame_image(self, frame_image: Optional[Image.Image]) -> None:
+        self._frame_image = frame_image
+        self._frame_plane = None
+
+
+    def _image_from_plane(self, plane: Any) -> Image.Image:
+        """Unpack a packed rgb24 av plane into a new PIL image."""
+        return Image.frombuffer("RGB", (plane.width, plane.height), memoryview(plane), "raw", "RGB", plane.line_size, 1)
+
+
+    def _pooled_image_from_plane(self, plane: Any) -> Image.Image:
+        """Unpack a packed rgb24 av plane into the next pooled PIL image. Main thread only."""
+        frame_size = (plane.width, plane.height)
+        frame_image = self._image_pool[self._image_idx]
+        if frame_image is None or frame_image.size != frame_size:
+            # Size changed: reallocate both images once, then decode into them in place every frame
+            self._image_pool = [Image.new("RGB", frame_size) for _ in range(2)]
+            frame_image = self._image_pool[self._image_idx]
+        # Unpack straight from the plane's memory rather than an intermediate bytes copy
+        frame_image.frombytes(memoryview(plane), "raw", "RGB", plane.line_size, 1)
+        self._image_idx ^= 1
+        return frame_image
+
+
+    def _schedule_frame(self) -> None:
+        """Queue the current frame for display on the main thread."""
         try:
-            existing_photoimage = getattr(self, "_current_imgtk", None)
-            if existing_photoimage and existing_photoimage.width() == self._current_frame_image.width and existing_photoimage.height() == self._current_frame_image.height:
-                try:
-                    existing_photoimage.paste(self._current_frame_image)
-                    self._safe_config_image(existing_photoimage)
-                    return
-                except Exception:
-                    pass
-            photo_image = self._create_photoimage(self._current_frame_image)
-            self._safe_config_image(photo_image)
-        except AttributeError:
+            self.after(0, self._apply_frame, self._frame_image, self._frame_plane)
+        except tk.TclError:
             pass
 
 
+    def _apply_frame(self, frame_image: Optional[Image.Image], frame_plane: Optional[Any] = None) -> None:
+        """Show a frame image or rgb24 plane on the label, then generate <<FrameGenerated>>. Main thread only."""
+        try:
+            if not self.winfo_exists():
+                return
+            if frame_plane is not None:
+                frame_size = (frame_plane.width, frame_plane.height)
+            elif frame_image is not None:
+                frame_size = frame_image.size
+            else:
+                return
+            photo_image = self._photo_pool[self._photo_idx]
+            if photo_image is None or (photo_image.width(), photo_image.height()) != frame_size:
+                # Size changed: reallocate both buffers once, then reuse them every frame
+                self._photo_pool = [self._create_blank_photoimage(frame_size) for _ in range(2)]
+                photo_image = self._photo_pool[self._photo_idx]
+                if photo_image is None:
+                    return
+            # Fill the buffer that is not currently displayed, then swap
+            if frame_plane is None or not _tkblit.put_block(photo_image, frame_plane):
+                if frame_image is None:
+                    # paste() copies the pixels, so the pooled image is free again once it returns
+                    frame_image = self._pooled_image_from_plane(frame_plane)
+                photo_image.paste(frame_image)
+            self.config(image=photo_image)
+            self._photo_idx ^= 1
+        except tk.TclError:
+            return
+        self._safe_generate_event("<<FrameGenerated>>")
+
+
 #endregion
 #region Load Thread
 
@@ -261,14 +398,18 @@ class TkinterVideo(tk.Label):
         Handles seeking, frame display, and frame rate consistency.
         """
         current_thread = threading.current_thread()
+        # Only this thread touches its container; a later play() may already have replaced self._video_container
+        container = None
         try:
-            with av.open(video_file_path) as self._video_container:
-                self._video_container.streams.video[0].thread_type = "AUTO"
-                video_stream = self._video_container.streams.video[0]
+            with self._open_container(video_file_path) as container:
+                self._video_container = container
+                container.streams.video[0].thread_type = "AUTO"
+                video_stream = container.streams.video[0]
                 try:
-                    self._video_info["framerate"] = int(video_stream.average_rate)
+                    self._framerate = int(video_stream.average_rate)
                 except TypeError:
                     raise TypeError("Not a video file")
+                self._video_info["framerate"] = self._framerate
                 try:
                     self._video_info["duration"] = float(video_stream.duration * video_stream.time_base)
                     self._safe_generate_event("<<Duration>>")
@@ -277,88 +418,217 @@ class TkinterVideo(tk.Label):
                 self._current_frame_number = 0
                 self._set_frame_size()
                 self.stream_base = video_stream.time_base
+                self._apply_lowres(video_stream.codec_context)
+                decoder = self._create_decoder(video_stream)
                 self._safe_generate_event("<<Loaded>>")
-                current_time_ms = self._get_time_in_ms()
-                previous_time_ms = current_time_ms
-                time_per_frame_ms = (1 / self._video_info["framerate"]) * 1000
+                # Pace against an absolute deadline so per-frame rounding never accumulates
+                frame_ns = int(1e9 / video_stream.average_rate)
+                next_deadline_ns = time.monotonic_ns()
+                last_display_ns = 0
+                skipped_frame = None
+                frames = self._demux_frames(video_stream, decoder)
                 while self._video_load_thread == current_thread and not self._should_stop:
                     if self._should_seek:
                         seek_time_us = int(self._seek_seconds * 1000000)
                         target_pts = self._seek_seconds / video_stream.time_base
-                        # video_stream no longer needed by the helper; call without it
-                        self._seek_and_decode_to_target_pts(seek_time_us, target_pts)
+                        self._seek_and_decode_to_target_pts(video_stream, decoder, seek_time_us, target_pts)
                         self._should_seek = False
                         self._seek_seconds = 0
+                        skipped_frame = None
+                        frames = self._demux_frames(video_stream, decoder)
+                        next_deadline_ns = time.monotonic_ns()
+                    if self._should_redraw:
+                        # Display size changed while paused; rescale the last decoded frame
+                        self._should_redraw = False
+                        if self._is_paused and self._last_av_frame is not None:
+                            self._update_current_frame(self._last_av_frame)
                     if self._is_paused:
-                        time.sleep(0.0001)
+                        if skipped_frame is not None:
+                            # Show the frame playback actually stopped on
+                            self._update_current_frame(skipped_frame)
+                            skipped_frame = None
+                        # Block until play/seek/stop wakes us; the timeout bounds stop latency
+                        self._resume_event.wait(timeout=0.1)
+                        self._resume_event.clear()
+                        next_deadline_ns = time.monotonic_ns()
                         continue
-                    current_time_ms = self._get_time_in_ms()
-                    delta_ms = current_time_ms - previous_time_ms
-                    previous_time_ms = current_time_ms
                     try:
-                        frame = next(self._video_container.decode(video=0))
-                        self._process_frame(frame)
-                        if self.consistent_frame_rate:
-                            time.sleep(max((time_per_frame_ms - delta_ms) / 1000, 0))
+                        frame = next(frames, None)
+                        if frame is None:
+                            if skipped_frame is not None:
+                                self._update_current_frame(skipped_frame)
+                            break
+                        now_ns = time.monotonic_ns()
+                        # Behind schedule (or unpaced) and a frame was just shown: this one would be
+                        # overwritten before anyone sees it, so skip its resize and display
+                        is_late = now_ns > next_deadline_ns or not self.consistent_frame_rate
+                        display = not (is_late and now_ns - last_display_ns < frame_ns // 2)
+                        self._process_frame(frame, display)
+                        if display:
+                            last_display_ns = now_ns
+                            skipped_frame = None
+                        else:
+                            skipped_frame = frame
+                        next_deadline_ns += frame_ns
+                        delay_ns = next_deadline_ns - time.monotonic_ns()
+                        if delay_ns > 0 and self.consistent_frame_rate:
+                            time.sleep(delay_ns / 1e9)
                     except (StopIteration, av.error.EOFError, tk.TclError):
                         break
-            self._close_container()
         finally:
-            self._cleanup()
-            gc.collect()
+            self._close_container(container)
+            # After stop() or a restart the state belongs to someone else; leave it alone
+            if self._video_load_thread is current_thread:
+                self._cleanup()
+
+
+    def _open_container(self, video_file_path: str) -> Any:
+        """Open the av container, using hardware decoding if requested and available."""
+        if self._hwaccel:
+            # Unknown names map to "no device type" in PyAV and would silently pick any hardware config
+            if self._hwaccel not in hwdevices_available():
+                logger.warning("Hardware device %r is not available (have %s); using software decoding", self._hwaccel, hwdevices_available())
+                return av.open(video_file_path)
+            try:
+                hwaccel = HWAccel(device_type=self._hwaccel, allow_software_fallback=True)
+                return av.open(video_file_path, hwaccel=hwaccel)
+            except (av.error.FFmpegError, ValueError) as error:
+                logger.warning("Hardware device %r failed to open (%s); using software decoding", self._hwaccel, error)
+        return av.open(video_file_path)
+
+
+    def _apply_lowres(self, codec_context: Any) -> None:
+        """Ask the decoder for 1/2, 1/4 or 1/8 size output when the fixed display size is that much smaller.
+        Must be called before the codec context is opened.
+        """
+        display_width, display_height = self._current_display_size
+        # Scaled widgets can grow after load, and hardware decoders may reject lowres
+        if self.scaled or self._hwaccel or not display_width or not display_height:
+            return
+        # Use the smaller axis factor so neither axis ends up upscaled
+        scale = min(self._src_w / display_width, self._src_h / display_height)
+        if scale >= 2:
+            # Decoders without lowres support (e.g. H.264, HEVC, VP9, AV1) clamp this to 0
+            codec_context.options = dict(codec_context.options, lowres=str(min(3, int(math.log2(scale)))))
 
 
-    def _seek_and_decode_to_target_pts(self, seek_time_us: int, target_pts: float) -> None:
+    def _warn_if_lowres_limits(self, display_size: Optional[Tuple[int, int]] = None) -> None:
+        """Warn if the decoder's reduced resolution output is smaller than the display size.
+        With no display_size (scaled widgets can grow to any size), warn whenever lowres is in effect.
+        """
+        frame = self._last_av_frame
+        # lowres is fixed when the decoder opens; decoders that ignore it output full size frames
+        if frame is None or frame.width >= self._src_w:
+            return
+        if display_size is None or display_size[0] > frame.width or display_size[1] > frame.height:
+            logger.warning(
+                "Video is decoding at reduced resolution (%dx%d) for the previous display size; "
+                "frames will be upscaled until load() is called again",
+                frame.width, frame.height,
+            )
+
+
+    def _create_decoder(self, video_stream: Any) -> Optional[Any]:
+        """Create the decoder named by codec_name, or None to use the stream's default decoder."""
+        if not self._codec_name:
+            return None
+        stream_codec = video_stream.codec_context.codec
+        try:
+            # A decoder for another codec opens fine but fails on the first packet, so check up front
+            if av.Codec(self._codec_name, "r").id != stream_codec.id:
+                logger.warning("Decoder %r cannot decode %r streams; using the default decoder", self._codec_name, stream_codec.name)
+                return None
+            decoder = av.CodecContext.create(self._codec_name, "r")
+            decoder.extradata = video_stream.codec_context.extradata
+            decoder.thread_type = "AUTO"
+            self._apply_lowres(decoder)
+            decoder.open()
+            return decoder
+        except (av.error.FFmpegError, ValueError) as error:
+            # Decoder missing or its device unavailable
+            logger.warning("Decoder %r is unavailable (%s); using the default decoder", self._codec_name, error)
+            return None
+
+
+    def _demux_frames(self, video_stream: Any, decoder: Optional[Any]) -> Iterator[Any]:
+        """Yield decoded frames packet by packet so the decoder's thread pool can run ahead."""
+        for packet in video_stream.container.demux(video_stream):
+            decoded = decoder.decode(packet) if decoder else packet.decode()
+            for frame in decoded:
+                yield frame
+
+
+    def _seek_and_decode_to_target_pts(self, video_stream: Any, decoder: Optional[Any], seek_time_us: int, target_pts: float) -> None:
         """Seek and decode frames until reaching the target PTS."""
         try:
-            self._video_container.seek(seek_time_us, any_frame=False, backward=True)
+            video_stream.container.seek(seek_time_us, any_frame=False, backward=True)
         except Exception:
             # Seek failed for this version — give up silently
             return
+        if decoder:
+            decoder.flush_buffers()
 
-        for frame in self._video_container.decode(video=0):
+        for frame in self._demux_frames(video_stream, decoder):
             if frame.pts >= target_pts:
                 self._update_current_frame_data(frame)
-                self._safe_generate_event("<<FrameGenerated>>")
+                self._schedule_frame()
                 break
 
 
     # --- Frame Processing ---
-    def _process_frame(self, frame: Any) -> None:
-        """Update frame, timestamp, frame number, and generate frame event."""
-        self._update_current_frame(frame)
-        if self._current_frame_number % self._video_info["framerate"] == 0:
+    def _process_frame(self, frame: Any, display: bool = True) -> None:
+        """Update frame, timestamp, frame number, and generate frame event.
+        If display is False, only the timestamp and frame number are updated.
+        """
+        if display:
+            self._update_current_frame(frame)
+        else:
+            self._update_frame_position(frame)
+        if self._current_frame_number % self._framerate == 0:
             self._safe_generate_event("<<SecondChanged>>")
 
 
     def _update_current_frame(self, frame: Any) -> None:
-        """Update current frame image, timestamp, frame number, and generate frame event."""
+        """Update current frame image, timestamp, frame number, and schedule its display."""
         self._update_current_frame_data(frame)
-        self._safe_generate_event("<<FrameGenerated>>")
+        self._schedule_frame()
+
+
+    def _update_frame_position(self, frame: Any) -> None:
+        """Update timestamp and frame number without building the frame image."""
+        self._last_av_frame = frame
+        self._current_timestamp = float(frame.pts * self.stream_base)
+        self._current_frame_number = int(self._framerate * self._current_timestamp)
 
 
     def _update_current_frame_data(self, frame: Any) -> None:
         """Update current frame image, timestamp, and frame number."""
-        self._current_timestamp = float(frame.pts * self._video_container.streams.video[0].time_base)
-        self._current_frame_number = int(self._video_info["framerate"] * self._current_timestamp)
-        width, height = self._get_resized_dimensions(frame, self._current_display_size)
-        self._current_frame_image = frame.to_image(width=width, height=height, interpolation="FAST_BILINEAR")
+        self._update_frame_position(frame)
+        width, height = self._get_resized_dimensions(self._current_display_size)
+        # Fuse colour conversion and resize into one swscale pass, then wrap the RGB plane directly
+        with self._reformat_lock:
+            if (width, height) == (frame.width, frame.height):
+                # Native size: colour conversion only, no resampling pass
+                reformatted = self._reformatter.reformat(frame, format="rgb24")
+            else:
+                reformatted = self._reformatter.reformat(frame, width=width, height=height, format="rgb24", interpolation="FAST_BILINEAR")
+        # Display turns the plane into pixels on the main thread; the PIL image is only built if asked for
+        self._frame_plane = reformatted.planes[0]
+        self._frame_image = None
 
 
     # --- Frame/Image Utilities ---
-    def _get_resized_dimensions(self, frame: Any, target_display_size: Tuple[int, int]) -> Tuple[int, int]:
+    def _get_resized_dimensions(self, target_display_size: Tuple[int, int]) -> Tuple[int, int]:
         """Calculate resized dimensions according to aspect ratio settings."""
         width, height = target_display_size
-        if self._keep_aspect_ratio:
-            image_ratio = frame.width / frame.height
-            destination_ratio = width / height
-            if image_ratio != destination_ratio:
-                if image_ratio > destination_ratio:
-                    new_height = round(frame.height / frame.width * width)
-                    height = new_height
+        if self._keep_aspect_ratio and self._src_ratio:
+            # Width the source would have at this height; compare in pixels rather than ratios
+            fitted_width = self._src_ratio * height
+            if abs(fitted_width - width) > 0.5:
+                if fitted_width > width:
+                    height = round(width / self._src_ratio)
                 else:
-                    new_width = round(frame.width / frame.height * height)
-                    width = new_width
+                    width = round(fitted_width)
         return width, height
 
 
@@ -370,6 +640,14 @@ class TkinterVideo(tk.Label):
             return None
 
 
+    def _create_blank_photoimage(self, size: Tuple[int, int]) -> Optional[ImageTk.PhotoImage]:
+        """Create an empty RGB ImageTk.PhotoImage safely (returns None on widget destruction)."""
+        try:
+            return ImageTk.PhotoImage("RGB", size, width=size[0], height=size[1])
+        except tk.TclError:
+            return None
+
+
     def _safe_config_image(self, photoimage: Optional[ImageTk.PhotoImage]) -> None:
         """Apply a PhotoImage to the label on the main thread if possible."""
         if photoimage is None:
@@ -399,30 +677,26 @@ class TkinterVideo(tk.Label):
 
 
     # --- Container & Cleanup ---
-    def _close_container(self) -> None:
-        """Safely close the av container and clear the reference."""
-        if self._video_container:
-            try:
-                self._video_container.close()
-            except Exception:
-                pass
+    def _close_container(self, container: Optional[Any]) -> None:
+        """Safely close an av container and clear the reference if it is the current one."""
+        if container is None:
+            return
+        try:
+            container.close()
+        except Exception:
+            pass
+        if self._video_container is container:
             self._video_container = None
 
 
     def _cleanup(self) -> None:
         self._current_frame_number = 0
+        self._last_av_frame = None
         self._is_paused = True
         self._should_stop = True
         if self._video_load_thread:
             self._video_load_thread = None
-        self._close_container()
         self._safe_generate_event("<<Ended>>")
 
 
-    # --- Misc Utilities ---
-    def _get_time_in_ms(self) -> int:
-        """Return current time in milliseconds."""
-        return time.time_ns() // 1_000_000
-
-
 #endregion